@@ -132,24 +132,27 @@ class BaseAgent(BaseModel, ABC):
             self.update_memory("user", request)
 
         results: List[str] = []
+        # Bind loop invariants locally to skip repeated attribute lookups per step
+        max_steps = self.max_steps
+        step = self.step
+        is_stuck = self.is_stuck
+        info = logger.info
         async with self.state_context(AgentState.RUNNING):
-            while (
-                self.current_step < self.max_steps and self.state != AgentState.FINISHED
-            ):
+            while self.current_step < max_steps and self.state != AgentState.FINISHED:
                 self.current_step += 1
-                logger.info(f"Executing step {self.current_step}/{self.max_steps}")
-                step_result = await self.step()
+                info(f"Executing step {self.current_step}/{max_steps}")
+                step_result = await step()
 
                 # Check for stuck state
-                if self.is_stuck():
+                if is_stuck():
                     self.handle_stuck_state()
 
                 results.append(f"Step {self.current_step}: {step_result}")
 
-            if self.current_step >= self.max_steps:
+            if self.current_step >= max_steps:
                 self.current_step = 0
                 self.state = AgentState.IDLE
-                results.append(f"Terminated: Reached max steps ({self.max_steps})")
+                results.append(f"Terminated: Reached max steps ({max_steps})")
         await SANDBOX_CLIENT.cleanup()
         return "\n".join(results) if results else "No steps executed"
 
@@ -169,21 +172,25 @@ class BaseAgent(BaseModel, ABC):
 
     def is_stuck(self) -> bool:
         """Check if the agent is stuck in a loop by detecting duplicate content"""
-        if len(self.memory.messages) < 2:
+        messages = self.memory.messages
+        if len(messages) < 2:
             return False
 
-        last_message = self.memory.messages[-1]
-        if not last_message.content:
+        last_content = messages[-1].content
+        if not last_content:
             return False
 
-        # Count identical content occurrences
-        duplicate_count = sum(
-            1
-            for msg in reversed(self.memory.messages[:-1])
-            if msg.role == "assistant" and msg.content == last_message.content
-        )
-
-        return duplicate_count >= self.duplicate_threshold
+        # Count identical content occurrences, stopping once the threshold is hit
+        threshold = self.duplicate_threshold
+        duplicate_count = 0
+        for i in range(len(messages) - 2, -1, -1):
+            msg = messages[i]
+            if msg.role == "assistant" and msg.content == last_content:
+                duplicate_count += 1
+                if duplicate_count >= threshold:
+                    return True
+
+        return duplicate_count >= threshold
 
     @property
     def messages(self) -> List[Message]:
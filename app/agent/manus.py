@@ -12,6 +12,10 @@ from app.tool.python_execute import PythonExecute
 from app.tool.str_replace_editor import StrReplaceEditor
 
 
+# Resolved once so the per-step browser check doesn't build a tool instance
+_BROWSER_TOOL_NAME: str = BrowserUseTool.model_fields["name"].default
+
+
 class Manus(ToolCallAgent):
     """A versatile general-purpose agent."""
 
@@ -47,7 +51,7 @@ class Manus(ToolCallAgent):
         original_prompt = self.next_step_prompt
         recent_messages = self.memory.messages[-3:] if self.memory.messages else []
         browser_in_use = any(
-            tc.function.name == BrowserUseTool().name
+            tc.function.name == _BROWSER_TOOL_NAME
             for msg in recent_messages
             if msg.tool_calls
             for tc in msg.tool_calls
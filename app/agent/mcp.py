@@ -70,8 +70,11 @@ class MCPAgent(ToolCallAgent):
         # Set available_tools to our MCP instance
         self.available_tools = self.mcp_clients
 
-        # Store initial tool schemas
-        await self._refresh_tools()
+        # Seed tool schemas from the listing done while connecting, avoiding a
+        # second list_tools round trip to the server
+        self.tool_schemas = {
+            name: tool.parameters for name, tool in self.mcp_clients.tool_map.items()
+        }
 
         # Add system message about available tools
         tool_names = list(self.mcp_clients.tool_map.keys())
@@ -97,18 +100,16 @@ class MCPAgent(ToolCallAgent):
         response = await self.mcp_clients.session.list_tools()
         current_tools = {tool.name: tool.inputSchema for tool in response.tools}
 
-        # Determine added, removed, and changed tools
-        current_names = set(current_tools.keys())
-        previous_names = set(self.tool_schemas.keys())
-
-        added_tools = list(current_names - previous_names)
-        removed_tools = list(previous_names - current_names)
-
-        # Check for schema changes in existing tools
+        # Determine added, removed, and changed tools in a single pass
+        previous_tools = self.tool_schemas
+        added_tools = []
         changed_tools = []
-        for name in current_names.intersection(previous_names):
-            if current_tools[name] != self.tool_schemas.get(name):
+        for name, schema in current_tools.items():
+            if name not in previous_tools:
+                added_tools.append(name)
+            elif previous_tools[name] != schema:
                 changed_tools.append(name)
+        removed_tools = [name for name in previous_tools if name not in current_tools]
 
         # Update stored schemas
         self.tool_schemas = current_tools